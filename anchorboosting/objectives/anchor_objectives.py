@@ -18,9 +18,9 @@ class AnchorKookClassificationObjective(ClassificationMixin, LGBMMixin, ProjMixi
     def __repr__(self):
         return f"AnchorKookClassificationObjective(gamma={self.gamma})"
 
-    def residuals(self, f, data):
-        residuals = self.predictions(f) - data.get_label()
-        return residuals
+    def residuals(self, f, data, predictions=None):
+        # The residuals are the gradient of the log-likelihood loss.
+        return ClassificationMixin.grad(self, f, data, predictions=predictions)
 
     def loss(self, f, data):
         return (
@@ -34,13 +34,17 @@ class AnchorKookClassificationObjective(ClassificationMixin, LGBMMixin, ProjMixi
             ** 2
         )
 
-    def grad(self, f, data):
-        predictions = self.predictions(f)
-        proj_residuals = self.proj(data.anchor, self.residuals(f, data), copy=False)
-
-        return super().grad(f, data) + 2 * (
-            self.gamma - 1
-        ) * proj_residuals * predictions * (1 - predictions)
+    def grad(self, f, data, predictions=None):
+        if predictions is None:
+            predictions = self.predictions(f)
+        residuals = self.residuals(f, data, predictions=predictions)
+        anchor_grad = self.proj(data.anchor, residuals, copy=True)
+        anchor_grad *= 2 * (self.gamma - 1)
+        anchor_grad *= predictions
+        anchor_grad *= 1 - predictions
+        # The gradient of the log-likelihood loss is equal to the residuals.
+        anchor_grad += residuals
+        return anchor_grad
 
 
 class AnchorKookMultiClassificationObjective(
@@ -58,13 +62,12 @@ class AnchorKookMultiClassificationObjective(
     def __repr__(self):
         return f"AnchorKookMultiClassificationObjective(gamma={self.gamma})"
 
-    def residuals(self, f, data):
-        predictions = self.predictions(f)
-        predictions[self._indices(data.get_label())] -= 1
-        return predictions.flatten("F")
+    def residuals(self, f, data, predictions=None):
+        # The residuals are the gradient of the log-likelihood loss.
+        return MultiClassificationMixin.grad(self, f, data, predictions=predictions)
 
     def loss(self, f, data):
-        residuals = self.residuals(f, data).reshape((-1, self.n_classes), order="F")
+        residuals = self._reshape(self.residuals(f, data))
         proj_residuals = self.proj(data.anchor, residuals, copy=False)
         # Multiply with self.factor to align two-class classification with
         # AnchorKookClassificationObjective
@@ -72,16 +75,23 @@ class AnchorKookMultiClassificationObjective(
             proj_residuals**2, axis=1
         )
 
-    def grad(self, f, data):
-        residuals = self.residuals(f, data).reshape((-1, self.n_classes), order="F")
-        proj_residuals = self.proj(data.anchor, residuals, copy=False)
+    def grad(self, f, data, predictions=None):
+        if predictions is None:
+            predictions = self.predictions(f)
+        residuals = self.residuals(f, data, predictions=predictions)
+        proj_residuals = self.proj(data.anchor, self._reshape(residuals), copy=True)
 
-        predictions = self.predictions(f)
-        proj_residuals -= np.sum(proj_residuals * predictions, axis=1, keepdims=True)
+        # Row-wise dot product without a (n, n_classes) temporary.
+        dot = np.einsum("ij,ij->i", proj_residuals, predictions)
+        proj_residuals -= dot[:, np.newaxis]
+        np.multiply(proj_residuals, predictions, out=proj_residuals)
         # Multiply with factor to align two-class classification with
         # AnchorKookClassificationObjective
-        anchor_grad = 2 * self.factor * (self.gamma - 1) * predictions * proj_residuals
-        return super().grad(f, data) + anchor_grad.flatten("F")
+        proj_residuals *= 2 * self.factor * (self.gamma - 1)
+        # The gradient of the log-likelihood loss is equal to the residuals. Add the
+        # anchor gradient in-place via the (n, n_classes) view of the flat residuals.
+        self._reshape(residuals)[:] += proj_residuals
+        return residuals
 
 
 class AnchorRegressionObjective(RegressionMixin, LGBMMixin, ProjMixin):
@@ -117,7 +127,9 @@ class AnchorRegressionObjective(RegressionMixin, LGBMMixin, ProjMixin):
     def grad(self, f, data):
         residuals = self.residuals(f, data)
         if self.gamma == 1:
-            return -residuals
+            return np.negative(residuals, out=residuals)
 
-        proj_residuals = self.proj(data.anchor, residuals, copy=True)
-        return -residuals - (self.gamma - 1) * proj_residuals
+        grad = self.proj(data.anchor, residuals, copy=True)
+        grad *= -(self.gamma - 1)
+        grad -= residuals
+        return grad
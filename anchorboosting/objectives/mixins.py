@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.special import expit
 
 from anchorboosting.utils import proj
 
@@ -59,7 +60,17 @@ class RegressionMixin:
         return 0.5 * (data.get_label() - f) ** 2
 
 
-class ClassificationMixin:
+class BaseClassificationMixin:
+    def objective(self, f, data):
+        """Objective function for LGBM. Computes the predictions only once."""
+        predictions = self.predictions(f)
+        return (
+            self.grad(f, data, predictions=predictions),
+            self.hess(f, data, predictions=predictions),
+        )
+
+
+class ClassificationMixin(BaseClassificationMixin):
     def init_score(self, y):
         """Initial score for LGBM.
 
@@ -91,7 +102,8 @@ class ClassificationMixin:
         np.ndarray of dimension (n,)
             Loss.
         """
-        return np.log(1 + np.exp((-2 * data.get_label() + 1) * f))
+        # log(1 + exp(x)) = logaddexp(0, x) without overflow for large x.
+        return np.logaddexp(0.0, (1 - 2 * data.get_label()) * f)
 
     def predictions(self, f):
         """Compute probability predictions from scores via softmax.
@@ -106,9 +118,9 @@ class ClassificationMixin:
         np.ndarray of dimension (n,)
             Vector with probabilities.
         """
-        return 1 / (1 + np.exp(-f))
+        return expit(f)
 
-    def grad(self, f, data):
+    def grad(self, f, data, predictions=None):
         """
         Gradient of the two-class log-likelihood loss.
 
@@ -118,10 +130,18 @@ class ClassificationMixin:
             Vector with scores.
         data: lgbm.Dataset
             LGBM dataset with labels of dimension (n,) in (0, 1).
+        predictions: np.ndarray of dimension (n,), optional, default=None
+            Probability predictions ``self.predictions(f)``. Computed if None. Not
+            modified.
         """
-        return self.predictions(f) - data.get_label()
-
-    def hess(self, f, data):
+        if predictions is None:
+            # Freshly computed predictions are owned. Modify them in-place.
+            grad = self.predictions(f)
+            grad -= data.get_label()
+            return grad
+        return predictions - data.get_label()
+
+    def hess(self, f, data, predictions=None):
         """
         Diagonal of the Hessian of the multi-class log-likelihood loss.
 
@@ -131,12 +151,26 @@ class ClassificationMixin:
             Vector with scores.
         data: lgbm.Dataset
             LGBM dataset with labels of dimension (n,) in (0, 1).
+        predictions: np.ndarray of dimension (n,), optional, default=None
+            Probability predictions ``self.predictions(f)``. Computed if None.
         """
-        predictions = self.predictions(f)
-        return predictions * (1.0 - predictions)
+        if predictions is None:
+            predictions = self.predictions(f)
+        hess = 1.0 - predictions
+        hess *= predictions
+        return hess
 
 
-class MultiClassificationMixin:
+class MultiClassificationMixin(BaseClassificationMixin):
+    """Multi-class log-likelihood loss.
+
+    LightGBM stores multi-class scores class-major, that is, the scores for class ``k``
+    are ``f[k * n:(k + 1) * n]``. This is the Fortran-order (column-major) layout of an
+    array of shape ``(n, n_classes)``. All methods work on F-contiguous views of this
+    shape (see ``_reshape``), such that no transposing copies are made and reductions
+    over classes stream over contiguous columns of length ``n``.
+    """
+
     def __init__(self, n_classes, **kwargs):
         super().__init__(**kwargs)
         self.n_classes = n_classes
@@ -153,14 +187,20 @@ class MultiClassificationMixin:
         Returns
         -------
         np.ndarray of dimension (n * n_classes,)
-            Initial scores for LGBM. Note that this is flattened.
+            Initial scores for LGBM. Note that this is flattened class-major.
         """
-        unique_values, unique_counts = np.unique(y, return_counts=True)
-        assert len(unique_values) == self.n_classes
-        assert (sorted(unique_values) == unique_values).all()
+        y = np.asarray(y).astype(np.intp)
+        assert y.min() >= 0
+        counts = np.bincount(y, minlength=self.n_classes)
+        assert len(counts) == self.n_classes
+        assert (counts > 0).all()
+
+        odds = counts / len(y)
+        return np.repeat(np.log(odds), len(y))
 
-        odds = np.array(unique_counts) / np.sum(unique_counts)
-        return np.log(np.tile(odds, (len(y), 1)).flatten("F"))
+    def _reshape(self, f):
+        """Reshape flat class-major scores to shape (n, n_classes) without copying."""
+        return f.reshape((-1, self.n_classes), order="F")
 
     def loss(self, f, data):
         """Multi-class negative log-likelihood loss.
@@ -177,14 +217,26 @@ class MultiClassificationMixin:
         np.ndarray of dimension (n,).
             Loss.
         """
-        y = data.get_label()
-        f = f.reshape((-1, self.n_classes), order="F")  # (n, n_classes)
-        f = f - np.max(f, axis=1)[:, np.newaxis]  # normalize f to avoid overflow
-        log_divisor = np.log(np.sum(np.exp(f), axis=1))
-        return -f[self._indices(y)] + log_divisor
-
-    def _indices(self, y):
-        return (np.arange(len(y)), y.astype(int))
+        f = self._reshape(f)  # (n, n_classes)
+        # normalize f to avoid overflow
+        f = np.subtract(f, np.max(f, axis=1, keepdims=True), dtype=float)
+        # f is F-contiguous, such that ravel is a view.
+        loss = -f.ravel("F")[self._flat_indices(data.get_label())]
+        np.exp(f, out=f)
+        log_divisor = np.sum(f, axis=1)
+        np.log(log_divisor, out=log_divisor)
+        loss += log_divisor
+        return loss
+
+    def _flat_indices(self, y):
+        """Indices of the true classes' entries in the flat class-major scores.
+
+        Entry ``(i, y[i])`` of the ``(n, n_classes)`` scores is at position
+        ``y[i] * n + i`` of the flat class-major array.
+        """
+        flat_indices = np.asarray(y).astype(np.intp) * len(y)
+        flat_indices += np.arange(len(y), dtype=np.intp)
+        return flat_indices
 
     def predictions(self, f):
         """Compute probability predictions from scores via softmax.
@@ -199,13 +251,14 @@ class MultiClassificationMixin:
         np.ndarray of dimension (n, n_classes)
             Vector with probabilities.
         """
-        f = f.reshape((-1, self.n_classes), order="F")  # (n, n_classes)
-        f = f - np.max(f, axis=1)[:, np.newaxis]  # normalize f to avoid overflow
-        predictions = np.exp(f)
-        predictions /= np.sum(predictions, axis=1)[:, np.newaxis]
+        f = self._reshape(f)  # (n, n_classes)
+        # normalize f to avoid overflow
+        predictions = np.subtract(f, np.max(f, axis=1, keepdims=True), dtype=float)
+        np.exp(predictions, out=predictions)
+        predictions /= np.sum(predictions, axis=1, keepdims=True)
         return predictions
 
-    def grad(self, f, data):
+    def grad(self, f, data, predictions=None):
         """
         Gradient of the multi-class log-likelihood loss.
 
@@ -215,14 +268,20 @@ class MultiClassificationMixin:
             Vector with scores.
         data: lgbm.Dataset
             LGBM dataset with labels of dimension (n,) in (0, ..., n_classes - 1).
+        predictions: np.ndarray of dimension (n, n_classes), optional, default=None
+            Probability predictions ``self.predictions(f)``. Computed if None. Not
+            modified.
         """
-        y = data.get_label()
-        predictions = self.predictions(f)
-        predictions[self._indices(y)] -= 1
-
-        return predictions.flatten("F")
+        if predictions is None:
+            # Freshly computed predictions are F-contiguous and owned. Modify them
+            # in-place via a flat view instead of copying.
+            grad = self.predictions(f).ravel("F")
+        else:
+            grad = predictions.flatten("F")
+        grad[self._flat_indices(data.get_label())] -= 1
+        return grad
 
-    def hess(self, f, data):
+    def hess(self, f, data, predictions=None):
         """
         Diagonal of the Hessian of the multi-class log-likelihood loss.
 
@@ -232,6 +291,13 @@ class MultiClassificationMixin:
             Vector with scores.
         data: lgbm.Dataset
             LGBM dataset with labels of dimension (n,) in (0, ..., n_classes - 1).
+        predictions: np.ndarray of dimension (n, n_classes), optional, default=None
+            Probability predictions ``self.predictions(f)``. Computed if None.
         """
-        predictions = self.predictions(f).flatten("F")
-        return 1 / self.factor * predictions * (1.0 - predictions)
+        if predictions is None:
+            predictions = self.predictions(f)
+        predictions = predictions.ravel("F")  # view if predictions is F-contiguous
+        hess = 1.0 - predictions
+        hess *= predictions
+        hess /= self.factor
+        return hess
@@ -47,6 +47,26 @@ def test_anchor_kook_multi_classification_objective(gamma):
     np.testing.assert_allclose(grad_approx, grad, rtol=1e-5, atol=1e-6)
 
 
+@pytest.mark.parametrize("multi", [False, True])
+def test_anchor_kook_objective(multi):
+    X, y, a = simulate(f2, n=10)
+    rng = np.random.RandomState(0)
+    if multi:
+        loss = AnchorKookMultiClassificationObjective(n_classes=3, gamma=5)
+        y = (y > 0).astype(int) + (y > 1).astype(int)
+        f = rng.normal(size=3 * len(y))
+    else:
+        loss = AnchorKookClassificationObjective(gamma=5)
+        y = (y > 0).astype(int)
+        f = rng.normal(size=len(y))
+    data = lgb.Dataset(X, y)
+    data.anchor = a
+
+    grad, hess = loss.objective(f, data)
+    np.testing.assert_allclose(grad, loss.grad(f, data))
+    np.testing.assert_allclose(hess, loss.hess(f, data))
+
+
 @pytest.mark.parametrize("gamma", [0, 0.5, 1, 5, 100])
 def test_anchor_regression_objective(gamma):
     loss = AnchorRegressionObjective(gamma=gamma)
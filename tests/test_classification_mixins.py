@@ -29,6 +29,16 @@ def test_classification_mixin():
     np.testing.assert_allclose(hess_approx, hess, rtol=5e-4, atol=5e-4)
 
 
+def test_classification_mixin_large_scores():
+    loss = ClassificationMixin()
+    f = np.array([-1000.0, 1000.0, -1000.0, 1000.0])
+    data = lgb.Dataset(np.ones((4, 1)), np.array([0, 0, 1, 1]))
+
+    with np.errstate(over="raise"):
+        np.testing.assert_allclose(loss.loss(f, data), [0, 1000, 1000, 0])
+        np.testing.assert_allclose(loss.predictions(f), [0, 1, 0, 1])
+
+
 def test_multi_classification_mixin():
     loss = MultiClassificationMixin(n_classes=3)
     X, y, _ = simulate(f2, n=10)
@@ -49,17 +59,17 @@ def test_multi_classification_mixin():
 
 
 @pytest.mark.parametrize("y", [[0, 1, 3, 2, 2], [1, 1, 1, 0, 1]])
-def test_indices(y):
+def test_flat_indices(y):
     n_unique = len(np.unique(y))
     loss = MultiClassificationMixin(n_unique)
     y = np.array(y)
-    indices = loss._indices(y)
+    flat_indices = loss._flat_indices(y)
 
     array = np.zeros((len(y), n_unique))
     for i in range(len(y)):
         array[i, y[i]] = i
 
-    np.testing.assert_equal(array[indices], np.arange(len(y)))
+    np.testing.assert_equal(array.flatten("F")[flat_indices], np.arange(len(y)))
 
 
 @pytest.mark.parametrize(
@@ -76,15 +86,41 @@ def test_negative_log_likelihood_classification(y, f):
     data = lgb.Dataset(np.ones(len(y)), y)
     np.testing.assert_almost_equal(
         -loss.loss(f, data),
-        np.log(loss.predictions(f)[loss._indices(y)]),
+        np.log(loss.predictions(f).flatten("F")[loss._flat_indices(y)]),
     )
 
 
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_predictions_softmax(n_classes):
+    loss = MultiClassificationMixin(n_classes)
+    rng = np.random.RandomState(0)
+    f = rng.normal(size=(10, n_classes))
+    f[0, :] = 1000  # no overflow
+
+    expected = np.exp(f - f.max(axis=1, keepdims=True))
+    expected /= expected.sum(axis=1, keepdims=True)
+    with np.errstate(over="raise"):
+        predictions = loss.predictions(f.flatten("F"))
+    np.testing.assert_allclose(predictions, expected)
+
+
 @pytest.mark.parametrize(
-    "y", [[0, 1, 2, 2], [0, 1], [0, 1, 2, 3, 4, 5, 1, 1, 1, 2, 3, 5]]
+    "y, error",
+    [
+        ([0, 1, 2, 2], None),
+        ([0, 1], None),
+        ([0, 1, 2, 3, 4, 5, 1, 1, 1, 2, 3, 5], None),
+        ([0, 2, 5, 5], AssertionError),  # labels not in 0, ..., n_classes - 1
+        ([-1, 0, 1, 1], AssertionError),  # negative labels
+    ],
 )
-def test_init_scores_classification(y):
+def test_init_scores_classification(y, error):
     unique_values, unique_counts = np.unique(y, return_counts=True)
+    if error is not None:
+        with pytest.raises(error):
+            MultiClassificationMixin(len(unique_values)).init_score(y)
+        return
+
     expected = np.tile(np.array(unique_counts) / np.sum(unique_counts), (len(y), 1))
     loss = MultiClassificationMixin(len(unique_values))
     init_scores = loss.init_score(y).reshape(len(y), -1, order="F")